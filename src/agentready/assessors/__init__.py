@@ -6,6 +6,8 @@ across CLI modules (main.py, assess_batch.py, demo.py).
 v2.0.0: Updated with evidence-based rebalancing (ETH Zurich, Red Hat, Anthropic).
 """
 
+from functools import lru_cache
+
 from .adr_frontmatter import AdrFrontmatterAssessor
 from .base import BaseAssessor
 from .code_quality import (
@@ -59,6 +61,7 @@ from .verification import SingleFileVerificationAssessor
 
 __all__ = [
     "create_all_assessors",
+    "valid_attribute_ids",
     "BaseAssessor",
     "LintSuppressionAssessor",
     "LockFilesAssessor",
@@ -119,3 +122,13 @@ def create_all_assessors() -> list[BaseAssessor]:
     assessors.extend(create_stub_assessors())
 
     return assessors
+
+
+@lru_cache(maxsize=1)
+def valid_attribute_ids() -> frozenset[str]:
+    """Get the attribute IDs of all registered assessors.
+
+    Computed once per process so validation paths (e.g. checking --exclude
+    flags) don't re-instantiate every assessor just to read an ID.
+    """
+    return frozenset(a.attribute_id for a in create_all_assessors())
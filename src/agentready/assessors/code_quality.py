@@ -211,30 +211,25 @@ class TypeAnnotationsAssessor(BaseAssessor):
                 continue
 
         # Check pyproject.toml for [tool.mypy] and [tool.pyright]
-        pyproject_path = repository.path / "pyproject.toml"
-        if pyproject_path.exists():
-            try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-
-                mypy_cfg = data.get("tool", {}).get("mypy", {})
-                if (
-                    mypy_cfg.get("strict") is True
-                    or mypy_cfg.get("disallow_untyped_defs") is True
-                ):
-                    return 15.0, [
-                        "mypy strict mode configured in pyproject.toml "
-                        "(prevents new type violations)"
-                    ]
-
-                pyright_cfg = data.get("tool", {}).get("pyright", {})
-                if pyright_cfg.get("typeCheckingMode") == "strict":
-                    return 15.0, [
-                        "pyright strict mode configured in pyproject.toml "
-                        "(prevents new type violations)"
-                    ]
-            except (OSError, tomllib.TOMLDecodeError):
-                pass
+        # (shared parse cached on the Repository instance)
+        data = repository.pyproject
+        if data is not None:
+            mypy_cfg = data.get("tool", {}).get("mypy", {})
+            if (
+                mypy_cfg.get("strict") is True
+                or mypy_cfg.get("disallow_untyped_defs") is True
+            ):
+                return 15.0, [
+                    "mypy strict mode configured in pyproject.toml "
+                    "(prevents new type violations)"
+                ]
+
+            pyright_cfg = data.get("tool", {}).get("pyright", {})
+            if pyright_cfg.get("typeCheckingMode") == "strict":
+                return 15.0, [
+                    "pyright strict mode configured in pyproject.toml "
+                    "(prevents new type violations)"
+                ]
 
         # Check pyrightconfig.json (supports JSONC comments)
         pyright_path = repository.path / "pyrightconfig.json"
@@ -1341,17 +1336,12 @@ class LintConfigCoverageAssessor(BaseAssessor):
     def _collect_python_tools(self, repository: Repository) -> set[str]:
         tools: set[str] = set()
 
-        # pyproject.toml — [tool.X] sections
-        pyproject = repository.path / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                with open(pyproject, "rb") as f:
-                    data = tomllib.load(f)
-                for key, cfg in data.get("tool", {}).items():
-                    if cfg:  # section must have at least one key (not just the header)
-                        tools.add(key.lower())
-            except (OSError, tomllib.TOMLDecodeError):
-                pass
+        # pyproject.toml — [tool.X] sections (shared parse cached on Repository)
+        data = repository.pyproject
+        if data is not None:
+            for key, cfg in data.get("tool", {}).items():
+                if cfg:  # section must have at least one key (not just the header)
+                    tools.add(key.lower())
 
         # setup.cfg — [X] section headers
         setup_cfg = repository.path / "setup.cfg"
@@ -1,13 +1,14 @@
 """Structure assessors for project layout and separation of concerns."""
 
 import logging
+import mmap
 import os
 import re
-import tomllib
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import Iterator, Literal, TypedDict
 
 import requests
 
@@ -82,6 +83,128 @@ def _get_non_source_dirs() -> frozenset[str]:
     return _load_arsrc_file("Python.arsrc")
 
 
+# Directories that are never scanned for source files (vendored deps,
+# virtualenvs, VCS metadata). Pruned during traversal so we never descend
+# into them.
+_SKIP_DIRS = frozenset({".venv", "venv", "node_modules", ".git", ".tox"})
+
+# Catch-all module names that indicate poor separation of concerns.
+_ANTIPATTERN_NAMES = frozenset({"utils.py", "helpers.py", "common.py", "misc.py"})
+
+# The naming score floors at 0 after this many hits (-20 each) and evidence
+# shows at most three names, so further hits cannot change the finding.
+_ANTIPATTERN_HIT_CAP = 5
+
+# Root-level files that mark a repository as dedicated to tests.
+_TEST_INDICATORS = frozenset({"conftest.py", "pytest.ini"})
+
+# Recognized PR template filenames (GitHub accepts either case).
+_PR_TEMPLATE_NAMES = frozenset({"PULL_REQUEST_TEMPLATE.md", "pull_request_template.md"})
+
+# Byte-size bounds for the 500-line cohesion check. A file under the lower
+# bound almost never exceeds 500 lines; one over the upper bound essentially
+# always does. Only files between the bounds are opened and newline-counted,
+# so most files are classified from the stat alone.
+_COHESION_SIZE_LOWER = 2_000
+_COHESION_SIZE_UPPER = 20_000
+
+# Setup-command pattern for OneCommandSetupAssessor, compiled once at import
+# so each assessment skips the per-call regex cache lookup. The two original
+# patterns (anything + install/setup, known tool + subcommand) are fused into
+# one alternation so the README is scanned once instead of twice. Patterns
+# are bytes-mode: everything matched is ASCII, so the README never needs a
+# full UTF-8 decode — only the short matched command is decoded.
+_SETUP_CMD_RE = re.compile(
+    rb"(?:^|\n)(?:```(?:bash|sh|shell)?\n)?"
+    rb"(?:(?P<generic>[a-z\-_]+\s+(?:install|setup))"
+    rb"|(?P<tool>(?:make|npm|yarn|pnpm|pip|poetry|uv|cargo|go)\s+[a-z\-_]+))",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Markdown section delimiter used to find the first README sections.
+_SECTION_SPLIT = re.compile(rb"\n##\s+")
+
+_SETUP_KEYWORDS = (
+    b"install",
+    b"setup",
+    b"quick start",
+    b"getting started",
+    b"installation",
+)
+
+# How much of the README to read. Setup commands and the leading sections
+# live in the opening kilobytes; bounding the read keeps READMEs with inlined
+# generated docs off the hot path. Instructions buried beyond this window
+# would not count as "prominent" anyway.
+_README_READ_LIMIT = 65536
+
+
+def _iter_py_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for Python files under root, pruning ignored dirs.
+
+    Uses an explicit stack of os.scandir iterators instead of rglob so that
+    directories in _SKIP_DIRS are never descended into, and so the dir/file
+    type checks reuse the scandir results instead of issuing extra stat calls.
+    Yielding the DirEntry (rather than just the path) lets callers read the
+    cached stat result too.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Hidden dirs (.git, .mypy_cache, ...) never hold
+                            # project source; skip them wholesale
+                            if (
+                                entry.name not in _SKIP_DIRS
+                                and not entry.name.startswith(".")
+                            ):
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file(
+                            follow_symlinks=False
+                        ):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _count_lines(path: str, stop_after: int | None = None) -> int:
+    """Count newlines in a file without decoding or materializing lines.
+
+    Maps the file and walks b"\\n" positions with mmap.find, which delegates
+    each scan to libc's vectorized memchr (mmap objects have no count
+    method). Empty files and filesystems that refuse mmap fall back to
+    chunked binary reads. On both paths, stop_after lets callers that only
+    need a threshold comparison return early.
+    """
+    count = 0
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = mm.find(b"\n")
+                while pos != -1:
+                    count += 1
+                    if stop_after is not None and count > stop_after:
+                        return count
+                    pos = mm.find(b"\n", pos + 1)
+                return count
+        except (ValueError, OSError):
+            pass
+
+        while True:
+            chunk = f.read(1 << 16)
+            if not chunk:
+                return count
+            count += chunk.count(b"\n")
+            if stop_after is not None and count > stop_after:
+                return count
+
+
 class StandardLayoutAssessor(BaseAssessor):
     """Assesses standard project layout patterns.
 
@@ -131,11 +254,7 @@ class StandardLayoutAssessor(BaseAssessor):
             return self._assess_go_layout(repository)
 
         # Check for tests directory (either tests/ or test/)
-        tests_path = repository.path / "tests"
-        has_tests = tests_path.exists()
-        if not has_tests:
-            tests_path = repository.path / "test"
-            has_tests = tests_path.exists()
+        has_tests = repository.exists("tests") or repository.exists("test")
 
         # Check for source directory: src/ or project-named
         # Fix for #246: Detect project-named source directories
@@ -212,20 +331,21 @@ class StandardLayoutAssessor(BaseAssessor):
             - directory: str - name of the source directory
         """
         # Strategy 1: Check for src/ directory (PEP 517 recommended)
-        if (repository.path / "src").exists():
+        if repository.exists("src"):
             return {"found": True, "type": "src", "directory": "src/"}
 
         # Strategy 2: Look for project-named directory from pyproject.toml
         # Only use project-named detection when pyproject.toml exists to avoid
         # false positives from migrations/, config/, etc.
-        pyproject_exists = (repository.path / "pyproject.toml").exists()
+        pyproject_exists = repository.exists("pyproject.toml")
         package_name = self._get_package_name_from_pyproject(repository)
 
         if package_name:
             # Normalize package name (replace hyphens with underscores)
             normalized_name = package_name.replace("-", "_")
-            package_dir = repository.path / normalized_name
-            if package_dir.exists() and (package_dir / "__init__.py").exists():
+            if repository.exists(normalized_name) and repository.exists(
+                f"{normalized_name}/__init__.py"
+            ):
                 return {
                     "found": True,
                     "type": "project-named",
@@ -239,18 +359,24 @@ class StandardLayoutAssessor(BaseAssessor):
         # Mark as "heuristic" so evidence shows this is a best-guess match.
         # Fix: Run this whenever pyproject.toml exists, not just when name is found.
         if pyproject_exists:
-            for item in sorted(repository.path.iterdir(), key=lambda p: p.name):
-                if not item.is_dir():
+            non_source_dirs = _get_non_source_dirs()
+            for name, (is_dir, _) in sorted(repository.root_entries().items()):
+                if not is_dir:
                     continue
-                if item.name.startswith("."):
+                if name.startswith("."):
                     continue
-                if item.name.lower() in _get_non_source_dirs():
+                # Blocklist entries are all lowercase; only pay the .lower()
+                # allocation for names that actually contain uppercase chars
+                if name in non_source_dirs or (
+                    not name.islower() and name.lower() in non_source_dirs
+                ):
                     continue
-                if (item / "__init__.py").exists():
+                # One stat, and only for names that survived the blocklist
+                if os.path.isfile(os.path.join(repository.path, name, "__init__.py")):
                     return {
                         "found": True,
                         "type": "heuristic",
-                        "directory": f"{item.name}/",
+                        "directory": f"{name}/",
                     }
 
         return {"found": False, "type": "none", "directory": ""}
@@ -263,29 +389,22 @@ class StandardLayoutAssessor(BaseAssessor):
         Returns:
             Package name string or None if not found.
         """
-        pyproject_path = repository.path / "pyproject.toml"
-        if not pyproject_path.exists():
+        data = repository.pyproject
+        if data is None:
+            # If we can't read pyproject.toml, fall back to other strategies
             return None
 
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-
-            # PEP 621 format: [project].name
-            if "project" in data and "name" in data["project"]:
-                return data["project"]["name"]
-
-            # Poetry format: [tool.poetry].name
-            if (
-                "tool" in data
-                and "poetry" in data["tool"]
-                and "name" in data["tool"]["poetry"]
-            ):
-                return data["tool"]["poetry"]["name"]
+        # PEP 621 format: [project].name
+        if "project" in data and "name" in data["project"]:
+            return data["project"]["name"]
 
-        except (OSError, tomllib.TOMLDecodeError):
-            # If we can't read pyproject.toml, fall back to other strategies
-            pass
+        # Poetry format: [tool.poetry].name
+        if (
+            "tool" in data
+            and "poetry" in data["tool"]
+            and "name" in data["tool"]["poetry"]
+        ):
+            return data["tool"]["poetry"]["name"]
 
         return None
 
@@ -324,21 +443,15 @@ class StandardLayoutAssessor(BaseAssessor):
         # Strategy 2: Has test config files but NO pyproject.toml
         # Test-only repos rarely have pyproject.toml with [project] section.
         # Mixed projects (source + tests) typically DO have pyproject.toml.
-        has_pyproject = (repository.path / "pyproject.toml").exists()
-        if has_pyproject:
+        root_names = repository.root_entries().keys()
+        if "pyproject.toml" in root_names:
             # If pyproject.toml exists, this is likely a mixed project,
             # not a test-only repo. Don't mark as test-only just because
             # it has conftest.py or pytest.ini.
             return False
 
         # No pyproject.toml: check for test-specific config files
-        test_config_files = [
-            repository.path / "conftest.py",
-            repository.path / "pytest.ini",
-        ]
-        has_test_config = any(f.exists() for f in test_config_files)
-
-        return has_test_config
+        return not _TEST_INDICATORS.isdisjoint(root_names)
 
     def _assess_go_layout(self, repository: Repository) -> Finding:
         """Assess Go project layout.
@@ -590,6 +703,7 @@ project/
             ],
         )
 
+    @lru_cache(maxsize=None)
     def _create_remediation(self, has_source: bool, has_tests: bool) -> Remediation:
         """Create context-aware remediation guidance for standard layout.
 
@@ -709,7 +823,7 @@ class OneCommandSetupAssessor(BaseAssessor):
         """
         # Check if README exists
         readme_path = repository.path / "README.md"
-        if not readme_path.exists():
+        if not repository.exists("README.md"):
             return Finding.not_applicable(
                 self.attribute,
                 reason="No README found, cannot assess setup documentation",
@@ -718,9 +832,11 @@ class OneCommandSetupAssessor(BaseAssessor):
         score = 0
         evidence = []
 
-        # Read README
+        # Read README as raw bytes (bounded; see _README_READ_LIMIT). The
+        # searches below are ASCII, so no decode of the full file is needed.
         try:
-            readme_content = readme_path.read_text()
+            with open(readme_path, "rb") as f:
+                readme_content = f.read(_README_READ_LIMIT)
         except Exception as e:
             return Finding(
                 attribute=self.attribute,
@@ -769,21 +885,16 @@ class OneCommandSetupAssessor(BaseAssessor):
             error_message=None,
         )
 
-    def _find_setup_command(self, readme_content: str, languages: dict) -> str:
+    def _find_setup_command(self, readme_content: bytes, languages: dict) -> str:
         """Find setup command in README based on language.
 
+        Operates on raw README bytes; only the matched command is decoded.
         Returns the setup command if found, empty string otherwise.
         """
-        # Common setup patterns by language
-        patterns = [
-            r"(?:^|\n)(?:```(?:bash|sh|shell)?\n)?([a-z\-_]+\s+(?:install|setup))",
-            r"(?:^|\n)(?:```(?:bash|sh|shell)?\n)?((?:make|npm|yarn|pnpm|pip|poetry|uv|cargo|go)\s+[a-z\-_]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, readme_content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                return match.group(1).strip()
+        match = _SETUP_CMD_RE.search(readme_content)
+        if match:
+            command = match.group("generic") or match.group("tool")
+            return command.decode("utf-8", errors="replace").strip()
 
         return ""
 
@@ -803,30 +914,30 @@ class OneCommandSetupAssessor(BaseAssessor):
             "setup.py": "Python setup",
         }
 
+        # Single cached root listing instead of one stat per candidate
+        root_entries = repository.root_entries()
         for filename, description in files_to_check.items():
-            if (repository.path / filename).exists():
+            if filename in root_entries:
                 setup_files.append(filename)
 
         return setup_files
 
-    def _is_setup_prominent(self, readme_content: str) -> bool:
+    def _is_setup_prominent(self, readme_content: bytes) -> bool:
         """Check if setup instructions are in first 3 sections of README."""
-        # Split by markdown headers (## or ###)
-        sections = re.split(r"\n##\s+", readme_content)
+        # Split by markdown headers; maxsplit avoids scanning past the
+        # sections we care about
+        sections = _SECTION_SPLIT.split(readme_content, maxsplit=4)
 
         # Check first 3 sections (plus preamble)
-        first_sections = "\n".join(sections[:4])
-
-        setup_keywords = [
-            "install",
-            "setup",
-            "quick start",
-            "getting started",
-            "installation",
-        ]
+        first_sections = [section.lower() for section in sections[:4]]
 
-        return any(keyword in first_sections.lower() for keyword in setup_keywords)
+        return any(
+            keyword in section
+            for section in first_sections
+            for keyword in _SETUP_KEYWORDS
+        )
 
+    @lru_cache(maxsize=None)
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for one-command setup."""
         return Remediation(
@@ -988,47 +1099,43 @@ class IssuePRTemplatesAssessor(BaseAssessor):
         evidence = []
         template_count = 0
 
-        # Check for PR template (50%)
-        pr_template_paths = [
-            repository.path / ".github" / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / ".github" / "pull_request_template.md",
-        ]
+        # One scandir each for the root and .github/ covers all template probes
+        github_entries = repository.dir_entries(".github")
 
-        pr_template_found = any(p.exists() for p in pr_template_paths)
+        # Check for PR template (50%) — set intersections against the two
+        # cached listings, no per-name stats
+        pr_template_found = bool(_PR_TEMPLATE_NAMES & github_entries.keys()) or bool(
+            _PR_TEMPLATE_NAMES & repository.root_entries().keys()
+        )
 
         if pr_template_found:
             score += 50
             evidence.append("PR template found")
 
         # Check for issue templates (50%)
-        issue_template_dir = repository.path / ".github" / "ISSUE_TEMPLATE"
         issue_templates_found = False
 
-        if issue_template_dir.exists() and issue_template_dir.is_dir():
-            try:
-                md_templates = list(issue_template_dir.glob("*.md"))
-                yml_templates = list(issue_template_dir.glob("*.yml")) + list(
-                    issue_template_dir.glob("*.yaml")
-                )
-                template_count = len(md_templates) + len(yml_templates)
+        if github_entries.get("ISSUE_TEMPLATE", (False, False))[0]:
+            template_count = sum(
+                1
+                for name, (_, is_file) in repository.dir_entries(
+                    ".github/ISSUE_TEMPLATE"
+                ).items()
+                if is_file and name.endswith((".md", ".yml", ".yaml"))
+            )
 
-                if template_count >= 2:
-                    score += 50
-                    evidence.append(
-                        f"Issue templates found: {template_count} templates"
-                    )
-                    issue_templates_found = True
-                elif template_count == 1:
-                    score += 25
-                    evidence.append(
-                        "Issue template directory exists with 1 template (need ≥2)"
-                    )
-                    issue_templates_found = True
-                else:
-                    evidence.append("Issue template directory exists but is empty")
-            except OSError:
-                evidence.append("Could not read issue template directory")
+            if template_count >= 2:
+                score += 50
+                evidence.append(f"Issue templates found: {template_count} templates")
+                issue_templates_found = True
+            elif template_count == 1:
+                score += 25
+                evidence.append(
+                    "Issue template directory exists with 1 template (need ≥2)"
+                )
+                issue_templates_found = True
+            else:
+                evidence.append("Issue template directory exists but is empty")
 
         # Fall back to org-level .github repo if anything is still missing
         if not pr_template_found or not issue_templates_found:
@@ -1074,6 +1181,7 @@ class IssuePRTemplatesAssessor(BaseAssessor):
             error_message=None,
         )
 
+    @lru_cache(maxsize=None)
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for missing templates."""
         return Remediation(
@@ -1196,15 +1304,18 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         else:
             evidence.append("Layer-based directories detected (models/, views/, etc.)")
 
+        # One pruned walk feeds both the cohesion and naming checks
+        py_files, antipattern_hits = self._scan_repo(repository)
+
         # Check 2: File cohesion via size (30%)
-        cohesion_score, file_stats = self._check_file_cohesion(repository)
+        cohesion_score, file_stats = self._check_file_cohesion(py_files)
         score += cohesion_score * 0.3
         evidence.append(
             f"File cohesion: {file_stats['oversized']}/{file_stats['total']} files >500 lines"
         )
 
         # Check 3: Module naming (30%)
-        naming_score, antipatterns = self._check_module_naming(repository)
+        naming_score, antipatterns = self._check_module_naming(antipattern_hits)
         score += naming_score * 0.3
         if antipatterns:
             evidence.append(f"Anti-pattern files found: {', '.join(antipatterns[:3])}")
@@ -1229,15 +1340,12 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         # Layer-based anti-patterns (BAD)
         layer_dirs = ["models", "views", "controllers", "services"]
 
-        # Check src directory if it exists
-        check_path = repository.path / "src"
-        if not check_path.exists():
-            check_path = repository.path
+        # Check src directory if it exists; set lookups against the cached
+        # listing cost no syscalls once it is populated
+        root_names = repository.root_entries()
+        entries = repository.dir_entries("src") if "src" in root_names else root_names
 
-        found_layers = []
-        for layer in layer_dirs:
-            if (check_path / layer).exists():
-                found_layers.append(layer)
+        found_layers = [layer for layer in layer_dirs if layer in entries]
 
         # Score: 100 if no layers, 60 if any layers found
         if not found_layers:
@@ -1246,34 +1354,74 @@ class SeparationOfConcernsAssessor(BaseAssessor):
             # Penalty per layer directory
             return max(60.0, 100.0 - (len(found_layers) * 15))
 
-    def _check_file_cohesion(self, repository: Repository) -> tuple:
-        """Check file sizes as cohesion indicator."""
+    def _scan_repo(
+        self, repository: Repository
+    ) -> tuple[list[tuple[str, int]], list[str]]:
+        """Walk the repo once, collecting Python files and catch-all modules.
+
+        A single pruned os.scandir walk replaces the five recursive globs
+        previously issued by the cohesion and naming checks. Returns
+        ((py_file_path, size_bytes) pairs, antipattern_names); size is -1
+        when the file could not be statted.
+        """
+        py_files: list[tuple[str, int]] = []
+        antipattern_hits: list[str] = []
+
+        for entry in _iter_py_files(repository.path):
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                size = -1
+            py_files.append((entry.path, size))
+            if (
+                len(antipattern_hits) < _ANTIPATTERN_HIT_CAP
+                and entry.name in _ANTIPATTERN_NAMES
+            ):
+                antipattern_hits.append(entry.name)
+
+        return py_files, antipattern_hits
+
+    def _check_file_cohesion(self, py_files: list[tuple[str, int]]) -> tuple:
+        """Check file sizes as cohesion indicator.
+
+        The byte size from the scan pre-classifies most files; only those in
+        the ambiguous band are opened for an exact newline count.
+        """
         threshold = 500  # lines
         total_files = 0
         oversized_files = 0
+        ambiguous: list[str] = []
+
+        for py_file, size in py_files:
+            if 0 <= size < _COHESION_SIZE_LOWER:
+                total_files += 1
+            elif size > _COHESION_SIZE_UPPER:
+                total_files += 1
+                oversized_files += 1
+            else:
+                ambiguous.append(py_file)
 
-        # Check Python files
-        try:
-            py_files = list(repository.path.rglob("*.py"))
-            for py_file in py_files:
-                # Skip venv, node_modules, etc.
-                if any(
-                    part in py_file.parts
-                    for part in [".venv", "venv", "node_modules", ".git", ".tox"]
-                ):
-                    continue
-
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        lines = len(f.readlines())
-                    total_files += 1
-                    if lines > threshold:
-                        oversized_files += 1
-                except (OSError, UnicodeDecodeError):
-                    continue
+        def _count_one(path: str) -> int | None:
+            try:
+                return _count_lines(path, stop_after=threshold)
+            except OSError:
+                return None
+
+        if len(ambiguous) > 4:
+            # Line counting is I/O-bound and read() releases the GIL, so a
+            # thread pool overlaps the page-cache reads across files.
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                counts = list(executor.map(_count_one, ambiguous))
+        else:
+            counts = [_count_one(path) for path in ambiguous]
 
-        except OSError:
-            pass
+        for lines in counts:
+            if lines is None:
+                continue
+            total_files += 1
+            if lines > threshold:
+                oversized_files += 1
 
         if total_files == 0:
             return 100.0, {"total": 0, "oversized": 0}
@@ -1284,34 +1432,18 @@ class SeparationOfConcernsAssessor(BaseAssessor):
 
         return cohesion_score, {"total": total_files, "oversized": oversized_files}
 
-    def _check_module_naming(self, repository: Repository) -> tuple:
-        """Check for catch-all module anti-patterns."""
-        antipattern_names = ["utils.py", "helpers.py", "common.py", "misc.py"]
-
-        found = []
-        try:
-            for pattern in antipattern_names:
-                matches = list(repository.path.rglob(pattern))
-                # Filter out venv/node_modules
-                matches = [
-                    m
-                    for m in matches
-                    if not any(
-                        part in m.parts
-                        for part in [".venv", "venv", "node_modules", ".git", ".tox"]
-                    )
-                ]
-                if matches:
-                    found.extend([m.name for m in matches])
-
-        except OSError:
-            pass
+    def _check_module_naming(self, antipattern_hits: list[str]) -> tuple:
+        """Check for catch-all module anti-patterns.
 
+        Takes the antipattern file names collected by _scan_repo rather
+        than re-walking the repository.
+        """
         # Score: 100 if none found, -20 per antipattern file
-        naming_score = max(0, 100.0 - (len(found) * 20))
+        naming_score = max(0, 100.0 - (len(antipattern_hits) * 20))
 
-        return naming_score, found
+        return naming_score, antipattern_hits
 
+    @lru_cache(maxsize=None)
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for separation of concerns."""
         return Remediation(
@@ -1568,6 +1700,7 @@ class ArchitecturalBoundaryAssessor(BaseAssessor):
                 evidence.append(f"dependency-cruiser config: {config_name}")
                 return
 
+    @lru_cache(maxsize=None)
     def _create_remediation(self) -> Remediation:
         return Remediation(
             summary="Configure import boundary rules in your linter",
@@ -5,6 +5,8 @@ enhanced later with more sophisticated detection and scoring logic.
 """
 
 import json
+import re
+from functools import cached_property
 from pathlib import Path
 
 import yaml
@@ -13,8 +15,44 @@ from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
 from ..utils.subprocess_utils import safe_subprocess_run
+from ..utils.yaml_utils import yaml_safe_load
 from .base import BaseAssessor
 
+# Lock-file lookup tables, built once at import. Membership against the
+# cached root listing is a single C-level set intersection per assess call.
+# Language-specific lock files (auto-managed, always have exact versions)
+_STRICT_LOCK_FILES = frozenset(
+    {
+        "package-lock.json",  # npm
+        "yarn.lock",  # Yarn
+        "pnpm-lock.yaml",  # pnpm
+        "poetry.lock",  # Poetry
+        "Pipfile.lock",  # Pipenv
+        "uv.lock",  # uv
+        "Cargo.lock",  # Rust
+        "Gemfile.lock",  # Ruby
+        "go.sum",  # Go
+        "pdm.lock",  # pdm
+    }
+)
+
+# Manual lock files (need validation)
+_MANUAL_LOCK_FILES = frozenset({"requirements.txt"})  # Python pip
+
+# Pre-commit hooks that enforce conventional commits. Kept as a tuple for the
+# YAML repo-URL walk, with a single compiled alternation for the raw-bytes
+# presence scan so the file is traversed once however many markers we add.
+# Note: gitlint and committed are generic linters that don't enforce
+# conventional commits by default. So they are not being added.
+_CONVENTIONAL_PRECOMMIT_HOOKS = (
+    "conventional-precommit-linter",
+    "conventional-pre-commit",
+    "commitlint-pre-commit-hook",
+)
+_CONVENTIONAL_PRECOMMIT_RE = re.compile(
+    b"|".join(re.escape(p.encode("ascii")) for p in _CONVENTIONAL_PRECOMMIT_HOOKS)
+)
+
 
 class DependencyPinningAssessor(BaseAssessor):
     """Tier 1 Essential - Dependency version pinning for reproducible builds.
@@ -31,7 +69,7 @@ class DependencyPinningAssessor(BaseAssessor):
     def tier(self) -> int:
         return 1
 
-    @property
+    @cached_property
     def attribute(self) -> Attribute:
         return Attribute(
             id=self.attribute_id,
@@ -45,25 +83,10 @@ class DependencyPinningAssessor(BaseAssessor):
 
     def assess(self, repository: Repository) -> Finding:
         """Check for dependency lock files and validate version pinning quality."""
-        # Language-specific lock files (auto-managed, always have exact versions)
-        strict_lock_files = [
-            "package-lock.json",  # npm
-            "yarn.lock",  # Yarn
-            "pnpm-lock.yaml",  # pnpm
-            "poetry.lock",  # Poetry
-            "Pipfile.lock",  # Pipenv
-            "uv.lock",  # uv
-            "Cargo.lock",  # Rust
-            "Gemfile.lock",  # Ruby
-            "go.sum",  # Go
-            "pdm.lock",  # pdm
-        ]
-
-        # Manual lock files (need validation)
-        manual_lock_files = ["requirements.txt"]  # Python pip
-
-        found_strict = [f for f in strict_lock_files if (repository.path / f).exists()]
-        found_manual = [f for f in manual_lock_files if (repository.path / f).exists()]
+        # One cached scandir of the root instead of a stat per candidate file
+        root_names = repository.root_entries()
+        found_strict = sorted(_STRICT_LOCK_FILES & root_names.keys())
+        found_manual = sorted(_MANUAL_LOCK_FILES & root_names.keys())
 
         # Check subdirectories for Go monorepos (go.sum in module dirs)
         if "go.sum" not in found_strict:
@@ -234,7 +257,7 @@ class ConventionalCommitsAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2
 
-    @property
+    @cached_property
     def attribute(self) -> Attribute:
         return Attribute(
             id=self.attribute_id,
@@ -263,15 +286,15 @@ class ConventionalCommitsAssessor(BaseAssessor):
             "commitlint.config.ts",
             "commitlint.config.cts",
         ]
-        has_commitlint = any(
-            (repository.path / cfg).exists() for cfg in commitlint_configs
-        )
-        has_husky = (repository.path / ".husky").exists()
+        # Shared cached root listing; .husky (a directory) shows up the same way
+        root_names = repository.root_entries()
+        has_commitlint = any(cfg in root_names for cfg in commitlint_configs)
+        has_husky = ".husky" in root_names
 
         # Check for commitlint config in package.json (common in Node.js projects)
         package_json = repository.path / "package.json"
         has_package_commitlint = False
-        if package_json.exists():
+        if "package.json" in root_names:
             try:
                 package_data = json.loads(package_json.read_text())
                 has_package_commitlint = "commitlint" in package_data
@@ -282,37 +305,35 @@ class ConventionalCommitsAssessor(BaseAssessor):
         # Check for conventional commits in pre-commit config
         has_precommit_conventional = False
 
-        if precommit_config.exists():
+        if ".pre-commit-config.yaml" in root_names:
             try:
-                content = precommit_config.read_text()
-
-                # Note: gitlint and committed are generic linters that don't enforce
-                # conventional commits by default. So they are not being added.
-                conventional_patterns = {
-                    "conventional-precommit-linter",
-                    "conventional-pre-commit",
-                    "commitlint-pre-commit-hook",
-                }
-
-                # Parse YAML to check repo URLs (avoids false positives from comments)
-                try:
-                    data = yaml.safe_load(content)
-                    repos = data.get("repos", []) if isinstance(data, dict) else []
-
-                    for repo in repos:
-                        if not isinstance(repo, dict):
-                            continue
-                        repo_url = repo.get("repo", "")
-                        if any(
-                            pattern in repo_url for pattern in conventional_patterns
-                        ):
-                            has_precommit_conventional = True
-                            break
-
-                except yaml.YAMLError:
-                    # Return False on YAML parse failure - malformed configs shouldn't count as "configured"
-                    # Avoids false positives from string matching against comments or invalid syntax
-                    has_precommit_conventional = False
+                raw = precommit_config.read_bytes()
+
+                # Cheap bytes scan first: if no marker appears anywhere in the
+                # file, the YAML walk cannot match either, so skip the parse
+                # entirely in the common negative case.
+                if _CONVENTIONAL_PRECOMMIT_RE.search(raw):
+                    # Parse YAML to check repo URLs (avoids false positives
+                    # from comments)
+                    try:
+                        data = yaml_safe_load(raw)
+                        repos = data.get("repos", []) if isinstance(data, dict) else []
+
+                        for repo in repos:
+                            if not isinstance(repo, dict):
+                                continue
+                            repo_url = repo.get("repo", "")
+                            if any(
+                                pattern in repo_url
+                                for pattern in _CONVENTIONAL_PRECOMMIT_HOOKS
+                            ):
+                                has_precommit_conventional = True
+                                break
+
+                    except yaml.YAMLError:
+                        # Return False on YAML parse failure - malformed configs shouldn't count as "configured"
+                        # Avoids false positives from string matching against comments or invalid syntax
+                        has_precommit_conventional = False
             except OSError:
                 pass
 
@@ -382,7 +403,7 @@ class GitignoreAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2
 
-    @property
+    @cached_property
     def attribute(self) -> Attribute:
         return Attribute(
             id=self.attribute_id,
@@ -472,7 +493,7 @@ class GitignoreAssessor(BaseAssessor):
     def assess(self, repository: Repository) -> Finding:
         gitignore = repository.path / ".gitignore"
 
-        if not gitignore.exists():
+        if ".gitignore" not in repository.root_entries():
             return Finding(
                 attribute=self.attribute,
                 status="fail",
@@ -620,7 +641,7 @@ class FileSizeLimitsAssessor(BaseAssessor):
     def tier(self) -> int:
         return 2
 
-    @property
+    @cached_property
     def attribute(self) -> Attribute:
         return Attribute(
             id=self.attribute_id,
@@ -791,7 +812,7 @@ class StubAssessor(BaseAssessor):
     def tier(self) -> int:
         return self._tier
 
-    @property
+    @cached_property
     def attribute(self) -> Attribute:
         return Attribute(
             id=self._attr_id,
@@ -810,6 +831,12 @@ class StubAssessor(BaseAssessor):
         )
 
 
+# Stub assessors are immutable, so materialize them once at import rather
+# than rebuilding per CLI invocation. Currently empty: every former stub has
+# been implemented or removed.
+_STUB_ASSESSORS: tuple[StubAssessor, ...] = ()
+
+
 # Factory function to create all stub assessors
 def create_stub_assessors():
     """Create stub assessors for remaining attributes.
@@ -823,4 +850,4 @@ def create_stub_assessors():
     - issue_pr_templates → Implemented as IssuePRTemplatesAssessor
     - container_setup → Will be implemented separately with conditional applicability
     """
-    return []  # All stubs have been implemented or removed
+    return _STUB_ASSESSORS
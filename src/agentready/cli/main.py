@@ -2,6 +2,7 @@
 
 import json
 import sys
+from importlib import resources
 from pathlib import Path
 
 import click
@@ -14,7 +15,7 @@ except ImportError:
 
 from pydantic import ValidationError
 
-from ..assessors import create_all_assessors
+from ..assessors import create_all_assessors, valid_attribute_ids
 from ..models.config import Config
 from ..reporters.html import HTMLReporter
 from ..reporters.markdown import MarkdownReporter
@@ -265,13 +266,17 @@ def run_assessment(
 
     # Merge exclusions from CLI --exclude flag and config.excluded_attributes
     # Fix for #302: config.excluded_attributes was previously ignored
-    cli_exclusions = set(exclude or [])
-    config_exclusions = set(config.excluded_attributes if config else [])
-    all_exclusions = cli_exclusions | config_exclusions
+    # Most runs exclude nothing, so skip the set building entirely then.
+    if exclude or (config and config.excluded_attributes):
+        cli_exclusions = set(exclude or [])
+        config_exclusions = set(config.excluded_attributes if config else [])
+        all_exclusions = cli_exclusions | config_exclusions
+    else:
+        all_exclusions = set()
 
     # Validate exclusions (strict mode) - applies to both CLI and config sources
     if all_exclusions:
-        valid_ids = {a.attribute_id for a in all_assessors}
+        valid_ids = valid_attribute_ids()
         invalid_ids = all_exclusions - valid_ids
         if invalid_ids:
             # Determine source of invalid IDs for clearer error messages
@@ -420,8 +425,8 @@ def load_config(config_path: Path) -> Config:
     Uses Pydantic for automatic validation, replacing 67 lines of manual
     validation code with declarative field validators.
 
-    Security: Uses yaml.safe_load() for safe YAML parsing and Pydantic
-    validators for type checking and path sanitization.
+    Security: Uses safe YAML loading (no arbitrary object construction)
+    and Pydantic validators for type checking and path sanitization.
 
     Args:
         config_path: Path to YAML configuration file
@@ -434,11 +439,11 @@ def load_config(config_path: Path) -> Config:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If YAML parsing fails
     """
-    import yaml
+    from ..utils import yaml_safe_load
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml_safe_load(f)
 
         # Validate that data is a dictionary
         if not isinstance(data, dict):
@@ -542,12 +547,14 @@ def generate_config():
         # Read from current directory (development mode)
         example_content = example_path.read_text(encoding="utf-8")
     else:
-        # Fall back to package data (pip install mode)
-        # Use same pattern as rest of codebase (research_loader.py, scorer.py, etc.)
+        # Fall back to package data (pip install mode). importlib.resources
+        # resolves the bundled file even when installed from a zipped wheel,
+        # where Path(__file__).parent chains break.
         try:
-            package_data_dir = Path(__file__).parent.parent / "data"
-            package_example_path = package_data_dir / ".agentready-config.example.yaml"
-            example_content = package_example_path.read_text(encoding="utf-8")
+            package_example = resources.files("agentready").joinpath(
+                "data/.agentready-config.example.yaml"
+            )
+            example_content = package_example.read_text(encoding="utf-8")
         except FileNotFoundError:
             click.echo(
                 "Error: .agentready-config.example.yaml not found in current directory or package data",
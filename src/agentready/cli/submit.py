@@ -5,20 +5,28 @@ import json
 import os
 import re
 import shutil
+import string
 import subprocess
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from github import Github, GithubException
 
 UPSTREAM_REPO = "ambient-code/agentready"
 SUBPROCESS_TIMEOUT = 60  # seconds
+# Read-only preflight lookups (auth, repo metadata) normally answer in well
+# under a second; fail fast instead of hanging a whole minute on a flaky
+# connection. Writes (fork, branch, file, PR) keep the full timeout.
+PREFLIGHT_TIMEOUT = 8  # seconds
 MAX_ASSESSMENT_SIZE = 10 * 1024 * 1024  # 10 MB
 
-# Valid GitHub/GitLab org/repo name pattern: alphanumeric, hyphens, underscores, dots
-REPO_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9._-]+$")
+# Valid GitHub/GitLab org/repo names: alphanumeric, hyphens, underscores, dots.
+# Validation deletes every allowed character; anything left over (including
+# non-ASCII) marks the name invalid. str.translate over a small table beats a
+# regex match for short strings.
+_REPO_NAME_ALLOWED = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
 
 SUPPORTED_HOSTS = ("github.com", "gitlab.com")
 
@@ -39,11 +47,26 @@ def find_assessment_file(repository: str, assessment_file: str | None) -> Path:
     return latest.resolve() if latest.is_symlink() else latest
 
 
-def load_assessment(assessment_path: Path) -> dict:
-    """Load and validate assessment JSON."""
+def load_assessment(assessment_path: Path) -> tuple[dict, bytes]:
+    """Load and validate assessment JSON.
+
+    Rejects oversized files before parsing so a runaway assessment never
+    costs a multi-megabyte JSON decode. Returns the parsed data together
+    with the raw bytes so the submit paths can upload the same buffer
+    without re-reading the file.
+    """
     try:
-        with open(assessment_path, encoding="utf-8") as f:
-            return json.load(f)
+        file_size = assessment_path.stat().st_size
+        if file_size > MAX_ASSESSMENT_SIZE:
+            click.echo(
+                f"Error: Assessment file too large ({file_size / 1024 / 1024:.1f} MB). "
+                f"Maximum allowed: {MAX_ASSESSMENT_SIZE / 1024 / 1024:.0f} MB",
+                err=True,
+            )
+            sys.exit(1)
+        # One read into a single buffer beats json.load's incremental reads
+        raw = assessment_path.read_bytes()
+        return json.loads(raw), raw
     except (json.JSONDecodeError, IOError) as e:
         click.echo(f"Error: Failed to read assessment file: {e}", err=True)
         sys.exit(1)
@@ -116,7 +139,12 @@ def extract_repo_info(assessment_data: dict) -> tuple[str, str, float, str, str,
     repo = path_parts[-1]
 
     # Validate org/repo names to prevent path injection
-    if not REPO_NAME_PATTERN.match(org) or not REPO_NAME_PATTERN.match(repo):
+    if (
+        not org
+        or not repo
+        or org.translate(_REPO_NAME_ALLOWED)
+        or repo.translate(_REPO_NAME_ALLOWED)
+    ):
         click.echo(
             f"Error: Invalid org/repo name: {org}/{repo}",
             err=True,
@@ -167,11 +195,36 @@ Submitted via `agentready submit` command.
 """
 
 
+GH_MAX_RETRIES = 3
+
+# gh surfaces rate limiting in stderr; the API may include a Retry-After hint
+_RATE_LIMIT_RETRY_AFTER = re.compile(r"retry.after[:\s]+(\d+)", re.IGNORECASE)
+
+
+def _rate_limit_delay(stderr: str, attempt: int) -> int | None:
+    """Return seconds to wait before retrying a rate-limited gh call.
+
+    Returns None when stderr does not look like a primary/secondary rate
+    limit response. Honors a Retry-After hint when present, otherwise backs
+    off exponentially (2s, 4s, 8s...), capped at 60s.
+    """
+    lowered = stderr.lower()
+    if "rate limit" not in lowered and "http 429" not in lowered:
+        return None
+    match = _RATE_LIMIT_RETRY_AFTER.search(stderr)
+    delay = int(match.group(1)) if match else 2 ** (attempt + 1)
+    return min(delay, 60)
+
+
 def run_gh_command(
     args: list[str], capture_output: bool = True, timeout: int = SUBPROCESS_TIMEOUT
 ) -> subprocess.CompletedProcess:
     """Run a gh CLI command and return the result.
 
+    Rate-limited responses (secondary abuse limits, HTTP 429) are retried
+    with backoff up to GH_MAX_RETRIES attempts instead of failing straight
+    through to the caller's error handling.
+
     Args:
         args: Arguments to pass to gh CLI.
         capture_output: Whether to capture stdout/stderr.
@@ -180,17 +233,29 @@ def run_gh_command(
     Returns:
         CompletedProcess with returncode, stdout, stderr.
     """
-    try:
-        result = subprocess.run(
-            ["gh"] + args,
-            capture_output=capture_output,
-            text=True,
-            timeout=timeout,
-        )
-        return result
-    except subprocess.TimeoutExpired:
-        click.echo(f"Error: gh command timed out after {timeout}s", err=True)
-        sys.exit(1)
+    for attempt in range(GH_MAX_RETRIES):
+        try:
+            result = subprocess.run(
+                ["gh"] + args,
+                capture_output=capture_output,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            click.echo(f"Error: gh command timed out after {timeout}s", err=True)
+            sys.exit(1)
+
+        if result.returncode == 0 or not capture_output:
+            return result
+
+        delay = _rate_limit_delay(result.stderr or "", attempt)
+        if delay is None or attempt == GH_MAX_RETRIES - 1:
+            return result
+
+        click.echo(f"GitHub rate limited; retrying in {delay}s...", err=True)
+        time.sleep(delay)
+
+    return result
 
 
 def submit_with_gh_cli(
@@ -198,8 +263,10 @@ def submit_with_gh_cli(
     repo: str,
     score: float,
     tier: str,
-    assessment_path: Path,
+    assessment_content: bytes,
     timestamp: str,
+    submission_path: str,
+    commit_message: str,
     host: str = "github.com",
     full_path: str = "",
 ) -> None:
@@ -211,55 +278,75 @@ def submit_with_gh_cli(
         )
         sys.exit(1)
 
-    # 2. Check authentication
-    result = run_gh_command(["auth", "status"])
-    if result.returncode != 0:
-        click.echo("Error: Not authenticated with gh CLI", err=True)
-        click.echo("\nRun: gh auth login", err=True)
-        sys.exit(1)
+    # 2. One GraphQL round trip replaces the old user/repo/fork REST probes.
+    # Each dropped call was a full gh subprocess launch plus network RTT, the
+    # dominant cost of this path. A missing submitted repo or fork shows up
+    # as a null field (gh exits non-zero but still prints the partial data).
+    gh_org_repo = full_path or f"{org}/{repo}"
+    browse_url = _repo_browse_url(host, gh_org_repo)
 
-    # 3. Get current user
-    result = run_gh_command(["api", "user", "--jq", ".login"])
-    if result.returncode != 0:
-        click.echo("Error: Failed to get current user", err=True)
+    viewer_fields = (
+        'viewer{login repository(name:"agentready")'
+        "{nameWithOwner defaultBranchRef{name target{oid}}}}"
+    )
+    if host == "github.com":
+        query = (
+            "query($owner:String!,$name:String!){"
+            + viewer_fields
+            + "submitted:repository(owner:$owner,name:$name)"
+            + "{isPrivate viewerPermission}}"
+        )
+        owner, _, name = gh_org_repo.partition("/")
+        args = [
+            "api",
+            "graphql",
+            "-f",
+            f"query={query}",
+            "-F",
+            f"owner={owner}",
+            "-F",
+            f"name={name}",
+        ]
+    else:
+        query = "query{" + viewer_fields + "}"
+        args = ["api", "graphql", "-f", f"query={query}"]
+
+    result = run_gh_command(args, timeout=PREFLIGHT_TIMEOUT)
+    try:
+        data = json.loads(result.stdout).get("data") or {}
+    except (json.JSONDecodeError, AttributeError):
+        data = {}
+    viewer = data.get("viewer") or {}
+    user = viewer.get("login", "")
+
+    if not user:
+        # Only now is it worth a second subprocess to tell auth failures apart
+        auth_result = run_gh_command(["auth", "status"], timeout=PREFLIGHT_TIMEOUT)
+        if auth_result.returncode != 0:
+            click.echo("Error: Not authenticated with gh CLI", err=True)
+            click.echo("\nRun: gh auth login", err=True)
+        else:
+            click.echo("Error: Failed to get current user", err=True)
         sys.exit(1)
-    user = result.stdout.strip()
     click.echo(f"Authenticated as: {user}\n")
 
-    # 4. Verify user has access to submitted repo
-    browse_url = _repo_browse_url(host, full_path or f"{org}/{repo}")
-
+    # 3. Verify user has access to submitted repo
     if host == "github.com":
-        # GitHub: use gh API for verification
-        gh_org_repo = full_path or f"{org}/{repo}"
-        result = run_gh_command(
-            [
-                "api",
-                f"repos/{gh_org_repo}",
-                "--jq",
-                "{private: .private, permissions: .permissions}",
-            ]
-        )
-        if result.returncode != 0:
+        submitted = data.get("submitted")
+        if not submitted:
             click.echo(
                 f"Error: Repository {gh_org_repo} not found or not accessible", err=True
             )
             sys.exit(1)
 
-        try:
-            repo_info = json.loads(result.stdout)
-        except json.JSONDecodeError as e:
-            click.echo(f"Error: Failed to parse GitHub API response: {e}", err=True)
-            sys.exit(1)
-        if repo_info.get("private"):
+        if submitted.get("isPrivate"):
             click.echo(
                 f"Error: Repository {gh_org_repo} is private. Only public repositories can be submitted.",
                 err=True,
             )
             sys.exit(1)
 
-        permissions = repo_info.get("permissions", {})
-        if not (permissions.get("push") or permissions.get("admin")):
+        if submitted.get("viewerPermission") not in ("ADMIN", "MAINTAIN", "WRITE"):
             click.echo(f"Error: You must have commit access to {gh_org_repo}", err=True)
             click.echo("\nYou can only submit repositories where you are:", err=True)
             click.echo("  - Repository owner", err=True)
@@ -292,13 +379,17 @@ def submit_with_gh_cli(
             "Maintainers will verify manually.",
         )
 
-    # 5. Fork upstream repo (if not already forked)
+    # 4. Fork upstream repo (if not already forked)
     click.echo(f"Found upstream: {UPSTREAM_REPO}")
 
-    # Check if fork exists
-    result = run_gh_command(["api", f"repos/{user}/agentready", "--jq", ".full_name"])
-    if result.returncode == 0:
-        click.echo(f"Using existing fork: {result.stdout.strip()}")
+    # Fork existence (and its main branch SHA) came back with the GraphQL call
+    fork_info = viewer.get("repository")
+    main_sha = ""
+    if fork_info:
+        click.echo(f"Using existing fork: {fork_info['nameWithOwner']}")
+        default_ref = fork_info.get("defaultBranchRef") or {}
+        if default_ref.get("name") == "main":
+            main_sha = (default_ref.get("target") or {}).get("oid") or ""
     else:
         # Create fork
         click.echo("Creating fork...")
@@ -308,17 +399,25 @@ def submit_with_gh_cli(
             sys.exit(1)
         click.echo(f"Created fork: {user}/agentready")
 
-    # 6. Create branch
+    # 5. Create branch
     branch_name = f"leaderboard-{org}-{repo}-{timestamp}"
 
-    # Get main branch SHA
-    result = run_gh_command(
-        ["api", f"repos/{user}/agentready/git/ref/heads/main", "--jq", ".object.sha"]
-    )
-    if result.returncode != 0:
-        click.echo("Error: Failed to get main branch SHA", err=True)
-        sys.exit(1)
-    main_sha = result.stdout.strip()
+    # Get main branch SHA (only needed when the fork was just created or its
+    # default branch isn't main)
+    if not main_sha:
+        result = run_gh_command(
+            [
+                "api",
+                f"repos/{user}/agentready/git/ref/heads/main",
+                "--jq",
+                ".object.sha",
+            ],
+            timeout=PREFLIGHT_TIMEOUT,
+        )
+        if result.returncode != 0:
+            click.echo("Error: Failed to get main branch SHA", err=True)
+            sys.exit(1)
+        main_sha = result.stdout.strip()
 
     # Create new branch
     result = run_gh_command(
@@ -338,30 +437,12 @@ def submit_with_gh_cli(
         sys.exit(1)
     click.echo(f"Created branch: {branch_name}")
 
-    # 7. Commit assessment file
-    # Check file size before reading
-    file_size = assessment_path.stat().st_size
-    if file_size > MAX_ASSESSMENT_SIZE:
-        click.echo(
-            f"Error: Assessment file too large ({file_size / 1024 / 1024:.1f} MB). "
-            f"Maximum allowed: {MAX_ASSESSMENT_SIZE / 1024 / 1024:.0f} MB",
-            err=True,
-        )
-        sys.exit(1)
-
-    with open(assessment_path, encoding="utf-8") as f:
-        content = f.read()
-
-    # Base64 encode the content
-    content_b64 = base64.b64encode(content.encode()).decode()
+    # 6. Commit assessment file (size already validated by load_assessment)
+    # Base64 straight from the shared buffer: no second file read, and no
+    # UTF-8 decode/encode round trip for a payload that can be 10 MB
+    content_b64 = base64.b64encode(assessment_content).decode("ascii")
 
     display_path = full_path or f"{org}/{repo}"
-    submission_path = f"submissions/{org}/{repo}/{timestamp}-assessment.json"
-    commit_message = (
-        f"feat: add {display_path} to leaderboard\n\n"
-        f"Score: {score:.1f}/100 ({tier})\n"
-        f"Repository: {browse_url}"
-    )
 
     result = run_gh_command(
         [
@@ -382,7 +463,7 @@ def submit_with_gh_cli(
         sys.exit(1)
     click.echo(f"Committed assessment to {submission_path}")
 
-    # 8. Create PR
+    # 7. Create PR
     pr_title = f"Leaderboard: {display_path} ({score:.1f}/100 - {tier})"
     pr_body = generate_pr_body(org, repo, score, tier, user, host, full_path)
 
@@ -424,55 +505,32 @@ def submit_with_gh_cli(
     )
 
 
-def submit_with_token(
-    org: str,
-    repo: str,
-    score: float,
-    tier: str,
-    assessment_path: Path,
-    timestamp: str,
-    host: str = "github.com",
-    full_path: str = "",
+def _verify_submitted_repo_access(
+    user,
+    host: str,
+    full_path: str,
+    browse_url: str,
+    gh_org_repo: str,
+    submitted_future,
 ) -> None:
-    """Submit assessment using GITHUB_TOKEN."""
-    # 1. Validate GitHub token
-    token = os.getenv("GITHUB_TOKEN")
-    if not token:
-        click.echo("Error: GITHUB_TOKEN environment variable not set", err=True)
-        click.echo(
-            "\nCreate token at: https://github.com/settings/tokens/new", err=True
-        )
-        click.echo(
-            "Required scopes: public_repo (for creating PRs to public repos)", err=True
-        )
-        click.echo("\nThen set it: export GITHUB_TOKEN=ghp_your_token_here", err=True)
-        click.echo("\nAlternatively, use --gh flag to submit via gh CLI.", err=True)
-        sys.exit(1)
-
-    display_path = full_path or f"{org}/{repo}"
-    browse_url = _repo_browse_url(host, display_path)
-    submission_path = f"submissions/{org}/{repo}/{timestamp}-assessment.json"
+    """Verify the submitter can publish the assessed repository.
 
-    # 2. Initialize GitHub client
-    try:
-        gh = Github(token)
-        user = gh.get_user()
-        click.echo(f"Authenticated as: {user.login}\n")
-    except GithubException as e:
-        click.echo(f"Error: Failed to authenticate with GitHub: {e}", err=True)
-        click.echo("Check that your GITHUB_TOKEN is valid.", err=True)
-        sys.exit(1)
+    For GitHub repos, consumes the concurrently fetched repository lookup
+    (submitted_future) and checks collaborator/owner status and visibility.
+    For GitLab/other hosts, falls back to a public git ls-remote probe.
+    Exits the process on any verification failure.
+    """
+    from github import GithubException
 
-    # 3. Verify user has access to submitted repo
-    if host == "github.com":
-        gh_org_repo = full_path or f"{org}/{repo}"
+    if submitted_future is not None:
         try:
-            submitted_repo = gh.get_repo(gh_org_repo)
+            submitted_repo = submitted_future.result()
 
-            is_collaborator = submitted_repo.has_in_collaborators(user.login)
-            is_owner = submitted_repo.owner.login == user.login
+            # Single permission-level request; owners report "admin", so this
+            # also covers the separate owner check.
+            permission = submitted_repo.get_collaborator_permission(user.login)
 
-            if not (is_collaborator or is_owner):
+            if permission not in ("admin", "maintain", "write"):
                 click.echo(
                     f"Error: You must have commit access to {gh_org_repo}", err=True
                 )
@@ -525,64 +583,120 @@ def submit_with_token(
             "Maintainers will verify manually.",
         )
 
-    # 4. Fork ambient-code/agentready (if not already forked)
-    try:
-        upstream = gh.get_repo(UPSTREAM_REPO)
-        click.echo(f"Found upstream: {UPSTREAM_REPO}")
 
-        # Check if user already has a fork
-        try:
-            fork = gh.get_repo(f"{user.login}/agentready")
-            click.echo(f"Using existing fork: {fork.full_name}")
-        except GithubException:
-            # Create fork
-            click.echo("Creating fork...")
-            fork = user.create_fork(upstream)
-            click.echo(f"Created fork: {fork.full_name}")
+def submit_with_token(
+    org: str,
+    repo: str,
+    score: float,
+    tier: str,
+    assessment_content: bytes,
+    timestamp: str,
+    submission_path: str,
+    commit_message: str,
+    host: str = "github.com",
+    full_path: str = "",
+) -> None:
+    """Submit assessment using GITHUB_TOKEN."""
+    # PyGithub drags in requests/urllib3/jwt (~200ms); only this path pays it
+    from github import Github, GithubException
 
-    except GithubException as e:
-        click.echo(f"Error: Cannot access {UPSTREAM_REPO}: {e}", err=True)
+    # 1. Validate GitHub token
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        click.echo("Error: GITHUB_TOKEN environment variable not set", err=True)
+        click.echo(
+            "\nCreate token at: https://github.com/settings/tokens/new", err=True
+        )
+        click.echo(
+            "Required scopes: public_repo (for creating PRs to public repos)", err=True
+        )
+        click.echo("\nThen set it: export GITHUB_TOKEN=ghp_your_token_here", err=True)
+        click.echo("\nAlternatively, use --gh flag to submit via gh CLI.", err=True)
         sys.exit(1)
 
-    # 5. Create branch
-    branch_name = f"leaderboard-{org}-{repo}-{timestamp}"
-    try:
-        # Get main branch reference
-        main_ref = fork.get_git_ref("heads/main")
-        main_sha = main_ref.object.sha
-
-        # Create new branch
-        fork.create_git_ref(f"refs/heads/{branch_name}", main_sha)
-        click.echo(f"Created branch: {branch_name}")
+    display_path = full_path or f"{org}/{repo}"
+    browse_url = _repo_browse_url(host, display_path)
 
+    # 2. Initialize GitHub client
+    try:
+        gh = Github(token)
+        user = gh.get_user()
+        click.echo(f"Authenticated as: {user.login}\n")
     except GithubException as e:
-        click.echo(f"Error: Failed to create branch: {e}", err=True)
+        click.echo(f"Error: Failed to authenticate with GitHub: {e}", err=True)
+        click.echo("Check that your GITHUB_TOKEN is valid.", err=True)
         sys.exit(1)
 
-    # 6. Commit assessment file
+    # The submitted-repo and fork lookups are independent network round
+    # trips, so fire them concurrently and consume the results in the
+    # original order. Error handling per lookup is unchanged.
+    executor = ThreadPoolExecutor(max_workers=2)
     try:
-        with open(assessment_path, encoding="utf-8") as f:
-            content = f.read()
+        submitted_future = None
+        gh_org_repo = full_path or f"{org}/{repo}"
+        if host == "github.com":
+            submitted_future = executor.submit(gh.get_repo, gh_org_repo)
+        fork_future = executor.submit(gh.get_repo, f"{user.login}/agentready")
 
-        commit_message = (
-            f"feat: add {display_path} to leaderboard\n\n"
-            f"Score: {score:.1f}/100 ({tier})\n"
-            f"Repository: {browse_url}"
+        # 3. Verify user has access to submitted repo
+        _verify_submitted_repo_access(
+            user, host, full_path, browse_url, gh_org_repo, submitted_future
         )
 
-        fork.create_file(
-            path=submission_path,
-            message=commit_message,
-            content=content,
-            branch=branch_name,
+        # 4. Fork ambient-code/agentready (if not already forked)
+        try:
+            # lazy=True skips the GET entirely: fork creation and the later
+            # create_pull only need the upstream's URL, which PyGithub can
+            # build from the constant name. Access problems still surface on
+            # the first write against it.
+            upstream = gh.get_repo(UPSTREAM_REPO, lazy=True)
+            click.echo(f"Found upstream: {UPSTREAM_REPO}")
+
+            # Check if user already has a fork
+            try:
+                fork = fork_future.result()
+                click.echo(f"Using existing fork: {fork.full_name}")
+            except GithubException:
+                # Create fork
+                click.echo("Creating fork...")
+                fork = user.create_fork(upstream)
+                click.echo(f"Created fork: {fork.full_name}")
+
+        except GithubException as e:
+            click.echo(f"Error: Cannot access {UPSTREAM_REPO}: {e}", err=True)
+            sys.exit(1)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # 5. Create branch with the assessment already committed. Building the
+    # blob/tree/commit through the Git Data API and only then pointing the
+    # branch ref at the finished commit avoids the old
+    # create-branch-then-create-file sequence, which left an empty branch
+    # behind whenever the file upload failed.
+    branch_name = f"leaderboard-{org}-{repo}-{timestamp}"
+    try:
+        from github import InputGitTreeElement
+
+        main_sha = fork.get_git_ref("heads/main").object.sha
+        base_commit = fork.get_git_commit(main_sha)
+
+        blob = fork.create_git_blob(
+            base64.b64encode(assessment_content).decode("ascii"), "base64"
+        )
+        tree = fork.create_git_tree(
+            [InputGitTreeElement(submission_path, "100644", "blob", sha=blob.sha)],
+            base_tree=base_commit.tree,
         )
+        commit = fork.create_git_commit(commit_message, tree, [base_commit])
+        fork.create_git_ref(f"refs/heads/{branch_name}", commit.sha)
+        click.echo(f"Created branch: {branch_name}")
         click.echo(f"Committed assessment to {submission_path}")
 
     except GithubException as e:
         click.echo(f"Error: Failed to commit file: {e}", err=True)
         sys.exit(1)
 
-    # 7. Create PR
+    # 6. Create PR
     try:
         pr_title = f"Leaderboard: {display_path} ({score:.1f}/100 - {tier})"
         pr_body = generate_pr_body(org, repo, score, tier, user.login, host, full_path)
@@ -655,16 +769,22 @@ def submit(repository, assessment_file, dry_run, use_gh_cli):
     """
     # 1. Find and load assessment
     assessment_path = find_assessment_file(repository, assessment_file)
-    assessment_data = load_assessment(assessment_path)
+    assessment_data, assessment_content = load_assessment(assessment_path)
 
     # 2. Extract repo info (now includes host and full_path for GitLab support)
     org, repo, score, tier, host, full_path = extract_repo_info(assessment_data)
 
     # 3. Generate timestamp
-    timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
+    # One C call, and datetime.utcnow() is deprecated since 3.12
+    timestamp = time.strftime("%Y-%m-%dT%H-%M-%S", time.gmtime())
     submission_path = f"submissions/{org}/{repo}/{timestamp}-assessment.json"
     display_path = full_path or f"{org}/{repo}"
     browse_url = _repo_browse_url(host, display_path)
+    commit_message = (
+        f"feat: add {display_path} to leaderboard\n\n"
+        f"Score: {score:.1f}/100 ({tier})\n"
+        f"Repository: {browse_url}"
+    )
 
     # 4. Handle dry-run
     if dry_run:
@@ -679,9 +799,27 @@ def submit(repository, assessment_file, dry_run, use_gh_cli):
     # 5. Submit using appropriate method
     if use_gh_cli:
         submit_with_gh_cli(
-            org, repo, score, tier, assessment_path, timestamp, host, full_path
+            org,
+            repo,
+            score,
+            tier,
+            assessment_content,
+            timestamp,
+            submission_path,
+            commit_message,
+            host,
+            full_path,
         )
     else:
         submit_with_token(
-            org, repo, score, tier, assessment_path, timestamp, host, full_path
+            org,
+            repo,
+            score,
+            tier,
+            assessment_content,
+            timestamp,
+            submission_path,
+            commit_message,
+            host,
+            full_path,
         )
@@ -1,6 +1,9 @@
 """Repository model representing the target git repository being assessed."""
 
+import os
+import tomllib
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -93,6 +96,96 @@ class Repository:
         repo.config = None
         return repo
 
+    @property
+    def _path_str(self) -> str:
+        """Repository root as a plain string (cached).
+
+        Hot existence checks go through os.path rather than composing Path
+        objects; pathlib stays at the API boundary (the `path` field).
+        """
+        value = self.__dict__.get("_path_str_cache")
+        if value is None:
+            value = os.fspath(self.path)
+            self.__dict__["_path_str_cache"] = value
+        return value
+
+    def exists(self, relative: str) -> bool:
+        """Check whether a path exists under the repository root, with caching.
+
+        Assessors repeatedly probe the same top-level paths (pyproject.toml,
+        README.md, tests/, .github/...). Caching per instance means each
+        unique path costs one stat() for the whole assessment run. The cache
+        is scoped to this Repository object, so a fresh scan of the same
+        repository sees fresh results.
+
+        Args:
+            relative: Path relative to the repository root
+
+        Returns:
+            True if the path exists
+        """
+        cache = self.__dict__.setdefault("_exists_cache", {})
+        result = cache.get(relative)
+        if result is None:
+            result = os.path.exists(os.path.join(self._path_str, relative))
+            cache[relative] = result
+        return result
+
+    def dir_entries(self, relative: str) -> dict[str, tuple[bool, bool]]:
+        """Get a cached listing of a directory under the repository root.
+
+        Args:
+            relative: Directory path relative to the repository root
+
+        Returns:
+            Mapping of entry name to (is_dir, is_file), built from a single
+            os.scandir call. Missing or unreadable directories map to an
+            empty dict. Listings are cached per instance so multiple
+            assessors probing the same directory share one read.
+        """
+        cache = self.__dict__.setdefault("_dir_entries_cache", {})
+        entries = cache.get(relative)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(os.path.join(self._path_str, relative)) as it:
+                    for entry in it:
+                        try:
+                            entries[entry.name] = (entry.is_dir(), entry.is_file())
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            cache[relative] = entries
+        return entries
+
+    def root_entries(self) -> dict[str, tuple[bool, bool]]:
+        """Get a cached listing of the repository root directory.
+
+        Returns:
+            Mapping of entry name to (is_dir, is_file), shared by all
+            assessors that inspect the root (source directory detection,
+            template checks, etc.)
+        """
+        return self.dir_entries(".")
+
+    @cached_property
+    def pyproject(self) -> dict | None:
+        """Parsed pyproject.toml contents, read and parsed once per instance.
+
+        Several assessors consult pyproject.toml (package name, tool
+        sections, type-checker config); sharing one parse avoids repeated
+        file reads and allocation-heavy TOML parsing.
+
+        Returns:
+            Parsed TOML as a dict, or None if the file is missing or invalid
+        """
+        try:
+            with open(os.path.join(self._path_str, "pyproject.toml"), "rb") as f:
+                return tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError):
+            return None
+
     @property
     def primary_language(self) -> str:
         """Get the primary programming language (most files).
@@ -1,6 +1,7 @@
 """Markdown reporter for generating version-control-friendly assessment reports."""
 
 from pathlib import Path
+from urllib.parse import quote
 
 from ..models.assessment import Assessment
 from .base import BaseReporter
@@ -18,6 +19,41 @@ class MarkdownReporter(BaseReporter):
     - Emoji indicators for status
     """
 
+    # Static lookup tables built once at class definition; the badge line
+    # renderer runs once per finding per report, so keep its hot path to
+    # dict lookups and a single f-string.
+    _STATUS_PRIORITY = {
+        "fail": 0,
+        "error": 1,
+        "pass": 2,
+        "skipped": 3,
+        "not_applicable": 4,
+    }
+
+    _BADGE_COLORS = {
+        "pass": "green",
+        "fail": "red",
+        "skipped": "lightgray",
+        "not_applicable": "lightgray",
+        "error": "yellow",
+    }
+
+    _STATUS_EMOJI = {
+        "pass": "✅",
+        "fail": "❌",
+        "skipped": "⊘",
+        "not_applicable": "⊘",
+        "error": "⚠️",
+    }
+
+    _CERT_EMOJI = {
+        "Platinum": "💎",
+        "Gold": "🥇",
+        "Silver": "🥈",
+        "Bronze": "🥉",
+        "Needs Improvement": "⚠️",
+    }
+
     def generate(self, assessment: Assessment, output_path: Path) -> Path:
         """Generate Markdown report from assessment data.
 
@@ -84,15 +120,7 @@ class MarkdownReporter(BaseReporter):
 
     def _generate_summary(self, assessment: Assessment) -> str:
         """Generate summary section with key metrics."""
-        # Certification emoji map
-        cert_emoji_map = {
-            "Platinum": "💎",
-            "Gold": "🥇",
-            "Silver": "🥈",
-            "Bronze": "🥉",
-            "Needs Improvement": "⚠️",
-        }
-        cert_emoji = cert_emoji_map.get(assessment.certification_level, "")
+        cert_emoji = self._CERT_EMOJI.get(assessment.certification_level, "")
 
         return f"""## 📊 Summary
 
@@ -124,25 +152,22 @@ class MarkdownReporter(BaseReporter):
 
     def _status_priority(self, status: str) -> int:
         """Get sort priority for status (lower = more important)."""
-        priority_map = {
-            "fail": 0,
-            "error": 1,
-            "pass": 2,
-            "skipped": 3,
-            "not_applicable": 4,
-        }
-        return priority_map.get(status, 99)
+        return self._STATUS_PRIORITY.get(status, 99)
 
     def _generate_badge_line(self, finding) -> str:
         """Generate single-line badge-style finding."""
-        from urllib.parse import quote
-
         # Badge components
         tier_label = f"T{finding.attribute.tier}"
 
-        # URL-safe attribute name
-        attr_name_safe = finding.attribute.name.replace(" ", "_")
-        attr_name_safe = quote(attr_name_safe, safe="_")
+        # shields.io path escaping: literal dash -> --, literal underscore ->
+        # __, space -> _; a single quote() pass covers everything else so
+        # clients don't re-escape the URL downstream
+        attr_name_safe = quote(
+            finding.attribute.name.replace("-", "--")
+            .replace("_", "__")
+            .replace(" ", "_"),
+            safe="_-",
+        )
 
         # Score for badge
         if finding.score is not None:
@@ -151,14 +176,7 @@ class MarkdownReporter(BaseReporter):
             score_text = "N--A"
 
         # Color based on status
-        color_map = {
-            "pass": "green",
-            "fail": "red",
-            "skipped": "lightgray",
-            "not_applicable": "lightgray",
-            "error": "yellow",
-        }
-        color = color_map.get(finding.status, "gray")
+        color = self._BADGE_COLORS.get(finding.status, "gray")
 
         # Build badge URL
         badge_message = f"{attr_name_safe}_{score_text}"
@@ -205,14 +223,7 @@ class MarkdownReporter(BaseReporter):
 
     def _get_status_emoji(self, status: str) -> str:
         """Get emoji for finding status."""
-        emoji_map = {
-            "pass": "✅",
-            "fail": "❌",
-            "skipped": "⊘",
-            "not_applicable": "⊘",
-            "error": "⚠️",
-        }
-        return emoji_map.get(status, "❓")
+        return self._STATUS_EMOJI.get(status, "❓")
 
     def _generate_finding_detail(self, finding) -> str:
         """Generate collapsible remediation section."""
@@ -1,5 +1,6 @@
 """Batch assessment orchestrator for multiple repositories."""
 
+import heapq
 import time
 from datetime import datetime
 from pathlib import Path
@@ -218,11 +219,12 @@ class BatchScanner:
                     attr_id = finding.attribute.id
                     failing_attributes[attr_id] = failing_attributes.get(attr_id, 0) + 1
 
-        top_failing = sorted(
+        # Top-10 selection without sorting every attribute
+        top_failing = heapq.nlargest(
+            10,
             failing_attributes.items(),
             key=lambda x: x[1],
-            reverse=True,
-        )[:10]
+        )
 
         top_failing_attributes = [
             {
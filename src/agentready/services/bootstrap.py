@@ -1,9 +1,11 @@
 """Bootstrap generator for repository infrastructure."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import List
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 
 from .language_detector import LanguageDetector
 
@@ -20,13 +22,51 @@ class BootstrapGenerator:
         """
         self.repo_path = repo_path
         self.language = self._detect_language(language)
-        self.env = Environment(
+
+    @cached_property
+    def env(self) -> Environment:
+        """Jinja2 environment, built on first render.
+
+        Lazy so callers that never render (e.g. path-only dry runs) skip
+        loader setup entirely. Compiled templates are cached on disk so
+        repeat CLI invocations skip the Jinja parse step.
+        """
+        try:
+            # No explicit directory: Jinja creates a per-user 0700 cache dir
+            # under the tempdir and verifies its ownership, so other local
+            # users cannot plant entries that marshal.loads would execute
+            bytecode_cache = FileSystemBytecodeCache()
+        except OSError:
+            # An unwritable temp dir only costs the warm-start speedup
+            bytecode_cache = None
+
+        return Environment(
             loader=PackageLoader("agentready", "templates/bootstrap"),
-            autoescape=select_autoescape(["html", "xml", "j2", "yaml", "yml"]),
+            # The templates produce YAML, Markdown and shell scripts written
+            # to disk, never served HTML, so HTML-escaping every substitution
+            # is pure overhead (and would corrupt output containing & or <)
+            autoescape=False,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
         )
 
+    @cached_property
+    def _template_names(self) -> frozenset:
+        """All template names in the loader, for existence checks.
+
+        Checking membership here replaces the old try/get_template/except
+        feature detect, which compiled the template just to throw it away
+        on the fallback path.
+        """
+        return frozenset(self.env.loader.list_templates())
+
+    def _template_language(self, rel_path: str) -> str:
+        """Return self.language if a template exists for it, else python."""
+        if f"{self.language}/{rel_path}" in self._template_names:
+            return self.language
+        return "python"
+
     def _detect_language(self, language: str) -> str:
         """Detect primary language if auto."""
         if language != "auto":
@@ -51,22 +91,29 @@ class BootstrapGenerator:
         Returns:
             List of created file paths
         """
-        created_files = []
-
-        # GitHub Actions workflows
-        created_files.extend(self._generate_workflows(dry_run))
-
-        # GitHub templates
-        created_files.extend(self._generate_github_templates(dry_run))
-
-        # Pre-commit hooks
-        created_files.extend(self._generate_precommit_config(dry_run))
+        generators = (
+            self._generate_workflows,  # GitHub Actions workflows
+            self._generate_github_templates,  # GitHub templates
+            self._generate_precommit_config,  # Pre-commit hooks
+            self._generate_dependabot,  # Dependabot
+            self._generate_docs,  # Contributing guidelines
+        )
 
-        # Dependabot
-        created_files.extend(self._generate_dependabot(dry_run))
+        created_files = []
 
-        # Contributing guidelines
-        created_files.extend(self._generate_docs(dry_run))
+        if dry_run:
+            # No file I/O to overlap; keep it simple
+            for generate in generators:
+                created_files.extend(generate(dry_run))
+            return created_files
+
+        # The generators write to independent paths and spend most of their
+        # time in blocking file I/O, so run them in a pool and collect the
+        # results in the original order.
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = [executor.submit(generate, dry_run) for generate in generators]
+            for future in futures:
+                created_files.extend(future.result())
 
         return created_files
 
@@ -76,36 +123,44 @@ class BootstrapGenerator:
         created = []
 
         # Determine test workflow language (fallback to python if template doesn't exist)
-        test_language = self.language
-        try:
-            self.env.get_template(f"{test_language}/workflows/tests.yml.j2")
-        except Exception:
-            # Template doesn't exist, fallback to python
-            test_language = "python"
+        test_language = self._template_language("workflows/tests.yml.j2")
 
         # AgentReady assessment workflow
-        agentready_workflow = workflows_dir / "agentready-assessment.yml"
-        template = self.env.get_template("workflows/agentready-assessment.yml.j2")
-        content = template.render(language=test_language)
-        created.append(self._write_file(agentready_workflow, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "workflows/agentready-assessment.yml.j2",
+                workflows_dir / "agentready-assessment.yml",
+                dry_run,
+                language=test_language,
+            )
+        )
 
         # Tests workflow
-        tests_workflow = workflows_dir / "tests.yml"
-        template = self.env.get_template(f"{test_language}/workflows/tests.yml.j2")
-        content = template.render()
-        created.append(self._write_file(tests_workflow, content, dry_run))
+        created.append(
+            self._render_to_file(
+                f"{test_language}/workflows/tests.yml.j2",
+                workflows_dir / "tests.yml",
+                dry_run,
+            )
+        )
 
         # Security workflow
-        security_workflow = workflows_dir / "security.yml"
-        template = self.env.get_template(f"{test_language}/workflows/security.yml.j2")
-        content = template.render()
-        created.append(self._write_file(security_workflow, content, dry_run))
+        created.append(
+            self._render_to_file(
+                f"{test_language}/workflows/security.yml.j2",
+                workflows_dir / "security.yml",
+                dry_run,
+            )
+        )
 
         # Repomix update workflow
-        repomix_workflow = workflows_dir / "repomix-update.yml"
-        template = self.env.get_template("workflows/repomix-update.yml.j2")
-        content = template.render()
-        created.append(self._write_file(repomix_workflow, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "workflows/repomix-update.yml.j2",
+                workflows_dir / "repomix-update.yml",
+                dry_run,
+            )
+        )
 
         return created
 
@@ -116,27 +171,39 @@ class BootstrapGenerator:
         # Issue templates
         issue_template_dir = self.repo_path / ".github" / "ISSUE_TEMPLATE"
 
-        bug_template = issue_template_dir / "bug_report.md"
-        template = self.env.get_template("issue_templates/bug_report.md.j2")
-        content = template.render()
-        created.append(self._write_file(bug_template, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "issue_templates/bug_report.md.j2",
+                issue_template_dir / "bug_report.md",
+                dry_run,
+            )
+        )
 
-        feature_template = issue_template_dir / "feature_request.md"
-        template = self.env.get_template("issue_templates/feature_request.md.j2")
-        content = template.render()
-        created.append(self._write_file(feature_template, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "issue_templates/feature_request.md.j2",
+                issue_template_dir / "feature_request.md",
+                dry_run,
+            )
+        )
 
         # PR template
-        pr_template = self.repo_path / ".github" / "PULL_REQUEST_TEMPLATE.md"
-        template = self.env.get_template("PULL_REQUEST_TEMPLATE.md.j2")
-        content = template.render()
-        created.append(self._write_file(pr_template, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "PULL_REQUEST_TEMPLATE.md.j2",
+                self.repo_path / ".github" / "PULL_REQUEST_TEMPLATE.md",
+                dry_run,
+            )
+        )
 
         # CODEOWNERS
-        codeowners = self.repo_path / ".github" / "CODEOWNERS"
-        template = self.env.get_template("CODEOWNERS.j2")
-        content = template.render()
-        created.append(self._write_file(codeowners, content, dry_run))
+        created.append(
+            self._render_to_file(
+                "CODEOWNERS.j2",
+                self.repo_path / ".github" / "CODEOWNERS",
+                dry_run,
+            )
+        )
 
         return created
 
@@ -145,23 +212,22 @@ class BootstrapGenerator:
         precommit_file = self.repo_path / ".pre-commit-config.yaml"
 
         # Determine language for template (fallback to python)
-        template_language = self.language
-        try:
-            template = self.env.get_template(f"{template_language}/precommit.yaml.j2")
-        except Exception:
-            # Template doesn't exist, fallback to python
-            template_language = "python"
-            template = self.env.get_template(f"{template_language}/precommit.yaml.j2")
+        template_language = self._template_language("precommit.yaml.j2")
 
-        content = template.render()
-        return [self._write_file(precommit_file, content, dry_run)]
+        return [
+            self._render_to_file(
+                f"{template_language}/precommit.yaml.j2", precommit_file, dry_run
+            )
+        ]
 
     def _generate_dependabot(self, dry_run: bool) -> List[Path]:
         """Generate Dependabot configuration."""
         dependabot_file = self.repo_path / ".github" / "dependabot.yml"
-        template = self.env.get_template("dependabot.yml.j2")
-        content = template.render(language=self.language)
-        return [self._write_file(dependabot_file, content, dry_run)]
+        return [
+            self._render_to_file(
+                "dependabot.yml.j2", dependabot_file, dry_run, language=self.language
+            )
+        ]
 
     def _generate_docs(self, dry_run: bool) -> List[Path]:
         """Generate contributing guidelines and code of conduct."""
@@ -170,26 +236,45 @@ class BootstrapGenerator:
         # CONTRIBUTING.md
         contributing = self.repo_path / "CONTRIBUTING.md"
         if not contributing.exists():  # Don't overwrite existing
-            template = self.env.get_template("CONTRIBUTING.md.j2")
-            content = template.render(language=self.language)
-            created.append(self._write_file(contributing, content, dry_run))
+            created.append(
+                self._render_to_file(
+                    "CONTRIBUTING.md.j2", contributing, dry_run, language=self.language
+                )
+            )
 
         # CODE_OF_CONDUCT.md (Red Hat standard)
         code_of_conduct = self.repo_path / "CODE_OF_CONDUCT.md"
         if not code_of_conduct.exists():
-            template = self.env.get_template("CODE_OF_CONDUCT.md.j2")
-            content = template.render()
-            created.append(self._write_file(code_of_conduct, content, dry_run))
+            created.append(
+                self._render_to_file("CODE_OF_CONDUCT.md.j2", code_of_conduct, dry_run)
+            )
 
         return created
 
+    def _render_to_file(
+        self, template_name: str, path: Path, dry_run: bool, **context
+    ) -> Path:
+        """Render a template straight to disk without building the full string.
+
+        Jinja2's streaming render writes chunks as they are produced, so
+        large documents never materialize in memory. Dry runs return the
+        path without touching the template loader at all.
+        """
+        if dry_run:
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.env.get_template(template_name).stream(**context).dump(
+            str(path), encoding="utf-8"
+        )
+        return path
+
     def _write_file(self, path: Path, content: str, dry_run: bool) -> Path:
         """Write file to disk or simulate for dry run."""
         if dry_run:
             return path
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        path.write_text(content, encoding="utf-8")
 
         return path
@@ -11,13 +11,17 @@ SECURITY REQUIREMENTS:
 - API errors caught and sanitized
 """
 
+import json
 import logging
 import os
 import re
 import time
+from pathlib import Path
 from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +55,14 @@ class GitHubOrgScanner:
     # Organization name pattern (alphanumeric and hyphens, max 39 chars)
     ORG_PATTERN = re.compile(r"^[a-zA-Z0-9-]{1,39}$")
 
+    # On-disk ETag cache for org listings. GitHub answers 304 Not Modified
+    # for unchanged pages, which costs no rate limit and transfers no body,
+    # so repeat scans of a quiet org become near-free.
+    # SECURITY: holds only public listing metadata and ETags, never the
+    # token. Requests with include_private=True bypass the cache entirely
+    # so private repo listings are never written to disk.
+    HTTP_CACHE_FILE = Path.home() / ".cache" / "agentready" / "github-http-cache.json"
+
     def __init__(self, token: Optional[str] = None):
         """Initialize GitHub scanner.
 
@@ -71,6 +83,43 @@ class GitHubOrgScanner:
 
         self._validate_token_format()
 
+        self._http_cache: Optional[dict] = None
+
+        # One pooled session reuses the TCP+TLS connection to api.github.com
+        # across paginated requests instead of handshaking per page, and
+        # retries transient server errors with backoff before the error
+        # handling in get_org_repos sees them.
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                ),
+            ),
+        )
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubOrgScanner":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _validate_token_format(self):
         """Validate GitHub token format.
 
@@ -81,6 +130,25 @@ class GitHubOrgScanner:
                 "Invalid GitHub token format. Expected format: ghp_<36 characters>"
             )
 
+    def _load_http_cache(self) -> dict:
+        """Load the ETag cache, tolerating a missing or corrupt file."""
+        if self._http_cache is None:
+            try:
+                self._http_cache = json.loads(self.HTTP_CACHE_FILE.read_text())
+            except (OSError, ValueError):
+                self._http_cache = {}
+        return self._http_cache
+
+    def _save_http_cache(self) -> None:
+        """Persist the ETag cache; a failed write only loses the speedup."""
+        if not self._http_cache:
+            return
+        try:
+            self.HTTP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self.HTTP_CACHE_FILE.write_text(json.dumps(self._http_cache))
+        except OSError:
+            logger.debug("Could not persist GitHub HTTP cache")
+
     def _redact_token(self, text: str) -> str:
         """Redact token from text for safe logging.
 
@@ -133,14 +201,18 @@ class GitHubOrgScanner:
                 "type": "all" if include_private else "public",
             }
 
+            # SECURITY: private listings (type=all) never touch the on-disk
+            # cache, so only public metadata is persisted
+            cache_key = f"{url}?page={page}&per_page={per_page}&type={params['type']}"
+            cached = None
+            if not include_private:
+                cached = self._load_http_cache().get(cache_key)
+
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github.v3+json",
-                    },
                     params=params,
+                    headers={"If-None-Match": cached["etag"]} if cached else None,
                     timeout=30,
                 )
                 response.raise_for_status()
@@ -178,11 +250,21 @@ class GitHubOrgScanner:
                 safe_error = self._redact_token(str(e))
                 raise GitHubAPIError(f"GitHub API request failed: {safe_error}")
 
-            # Parse response
-            try:
-                batch = response.json()
-            except ValueError:
-                raise GitHubAPIError("Invalid JSON response from GitHub API")
+            # Parse response; a 304 means the cached page is still current
+            if response.status_code == 304 and cached:
+                batch = cached["body"]
+            else:
+                try:
+                    batch = response.json()
+                except ValueError:
+                    raise GitHubAPIError("Invalid JSON response from GitHub API")
+
+                etag = response.headers.get("ETag")
+                if etag and not include_private:
+                    self._load_http_cache()[cache_key] = {
+                        "etag": etag,
+                        "body": batch,
+                    }
 
             # No more repos
             if not batch:
@@ -223,5 +305,7 @@ class GitHubOrgScanner:
             # SECURITY: Basic rate limiting (avoid hammering API)
             time.sleep(0.2)
 
+        self._save_http_cache()
+
         logger.info(f"Found {len(repos)} repositories in {org_name}")
         return repos[:max_repos]
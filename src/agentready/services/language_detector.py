@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 
 from ..utils.subprocess_utils import safe_subprocess_run
@@ -74,18 +75,15 @@ class LanguageDetector:
         self.repository_path = repository_path
         self.minimum_file_threshold = 3  # Need 3+ files to count as "using language"
 
-    def detect_languages(self) -> dict[str, int]:
-        """Detect languages in repository with file counts.
+    @cached_property
+    def _tracked_files(self) -> list[str]:
+        """Repository file listing, fetched once per instance.
 
-        Returns:
-            Dictionary mapping language name to file count
-            (e.g., {"Python": 42, "JavaScript": 18})
-
-        Only includes languages with >= minimum_file_threshold files.
+        detect_languages, count_total_files and count_total_lines all need
+        the same listing; caching it means one git ls-files subprocess per
+        scan instead of three. Tries git ls-files first (respects
+        .gitignore), falling back to a pathlib walk (less accurate).
         """
-        language_counts = defaultdict(int)
-
-        # Try git ls-files first (respects .gitignore)
         try:
             # Security: Use safe_subprocess_run for validation and limits
             result = safe_subprocess_run(
@@ -96,20 +94,27 @@ class LanguageDetector:
                 timeout=30,
                 check=True,
             )
-            files = result.stdout.strip().split("\n")
+            return [f for f in result.stdout.strip().split("\n") if f.strip()]
         except Exception:
-            # Fall back to pathlib walk (less accurate)
-            files = [
+            return [
                 str(f.relative_to(self.repository_path))
                 for f in self.repository_path.rglob("*")
                 if f.is_file()
             ]
 
-        # Count files by language
-        for file_path in files:
-            if not file_path.strip():
-                continue
+    def detect_languages(self) -> dict[str, int]:
+        """Detect languages in repository with file counts.
 
+        Returns:
+            Dictionary mapping language name to file count
+            (e.g., {"Python": 42, "JavaScript": 18})
+
+        Only includes languages with >= minimum_file_threshold files.
+        """
+        language_counts = defaultdict(int)
+
+        # Count files by language
+        for file_path in self._tracked_files:
             path = Path(file_path)
             suffix = path.suffix.lower()
 
@@ -131,21 +136,7 @@ class LanguageDetector:
         Returns:
             Total file count
         """
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-            return len([f for f in files if f.strip()])
-        except Exception:
-            # Fall back to pathlib
-            return sum(1 for _ in self.repository_path.rglob("*") if _.is_file())
+        return len(self._tracked_files)
 
     def count_total_lines(self) -> int:
         """Count total lines of code in repository.
@@ -158,28 +149,7 @@ class LanguageDetector:
         """
         total_lines = 0
 
-        try:
-            # Security: Use safe_subprocess_run for validation and limits
-            result = safe_subprocess_run(
-                ["git", "ls-files"],
-                cwd=self.repository_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
-            files = result.stdout.strip().split("\n")
-        except Exception:
-            files = [
-                str(f.relative_to(self.repository_path))
-                for f in self.repository_path.rglob("*")
-                if f.is_file()
-            ]
-
-        for file_path in files:
-            if not file_path.strip():
-                continue
-
+        for file_path in self._tracked_files:
             full_path = self.repository_path / file_path
 
             # Only count text files (skip binaries)
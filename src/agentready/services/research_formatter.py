@@ -4,6 +4,9 @@ import re
 from datetime import date
 from typing import Tuple
 
+# Trailing horizontal whitespace (including a stray \r) at end of line
+_TRAILING_WS = re.compile(r"[ \t\r]+$", re.MULTILINE)
+
 
 class ResearchFormatter:
     """Utilities for formatting and manipulating research reports."""
@@ -271,10 +274,9 @@ This document catalogs 25 high-impact attributes that make codebases optimal for
         # Ensure consistent spacing between sections (3 dashes become separator)
         content = re.sub(r"\n---\n", "\n\n---\n\n", content)
 
-        # Remove trailing whitespace
-        lines = content.splitlines()
-        lines = [line.rstrip() for line in lines]
-        content = "\n".join(lines)
+        # Remove trailing whitespace in one C-level pass instead of
+        # split/rstrip/join building a throwaway list of lines
+        content = _TRAILING_WS.sub("", content)
 
         # Remove multiple blank lines (max 2 consecutive blank lines)
         content = re.sub(r"\n{4,}", "\n\n\n", content)
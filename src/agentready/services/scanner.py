@@ -1,7 +1,9 @@
 """Scanner service orchestrating the assessment workflow."""
 
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -104,11 +106,26 @@ class Scanner:
             print(f"Languages detected: {', '.join(repository.languages.keys())}")
             print(f"\nEvaluating {len(assessors)} attributes...")
 
-        # Execute assessors with graceful degradation
-        findings = []
-        for assessor in assessors:
-            finding = self._execute_assessor(assessor, repository, verbose)
-            findings.append(finding)
+        # Execute assessors with graceful degradation. Assessors are
+        # independent and IO-bound (stat/scandir/file reads release the GIL),
+        # so run them through a thread pool when progress output doesn't need
+        # to stream one line at a time.
+        if verbose or len(assessors) <= 1:
+            findings = [
+                self._execute_assessor(assessor, repository, verbose)
+                for assessor in assessors
+            ]
+        else:
+            max_workers = min(len(assessors), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                findings = list(
+                    executor.map(
+                        lambda assessor: self._execute_assessor(
+                            assessor, repository, verbose
+                        ),
+                        assessors,
+                    )
+                )
 
         # Calculate scores
         overall_score = self.scorer.calculate_overall_score(findings, self.config)
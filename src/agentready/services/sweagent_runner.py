@@ -62,11 +62,20 @@ class SWEAgentRunner:
         if max_instances:
             cmd += ["--instances.slice", f":{max_instances}"]
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=7200  # 2 hour timeout
+        # SWE-agent logs heavily to stdout over a multi-hour run and we never
+        # read it, so discard it instead of buffering the whole stream in
+        # memory; stderr is kept only for error reporting.
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
+        try:
+            _, stderr = proc.communicate(timeout=7200)  # 2 hour timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
 
-        if result.returncode != 0:
-            raise RuntimeError(f"SWE-agent failed: {result.stderr}")
+        if proc.returncode != 0:
+            raise RuntimeError(f"SWE-agent failed: {stderr[-4096:]}")
 
         return output_file
@@ -68,10 +68,10 @@ class SWEBenchEvaluator:
         if result.returncode != 0:
             raise RuntimeError(f"Evaluation failed: {result.stderr}")
 
-        # Parse results
+        # Parse results; one bytes read skips text-mode decoding and json
+        # handles UTF-8 bytes directly
         results_file = output_dir / "results.json"
-        with open(results_file) as f:
-            results = json.load(f)
+        results = json.loads(results_file.read_bytes())
 
         total = results["total_instances"]
         resolved = results["resolved_instances"]
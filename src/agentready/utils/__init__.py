@@ -16,6 +16,7 @@ from .subprocess_utils import (
     sanitize_subprocess_error,
     validate_repository_path,
 )
+from .yaml_utils import yaml_safe_load
 
 __all__ = [
     "safe_subprocess_run",
@@ -30,4 +31,5 @@ __all__ = [
     "sanitize_error_message",
     "sanitize_metadata",
     "shorten_commit_hash",
+    "yaml_safe_load",
 ]
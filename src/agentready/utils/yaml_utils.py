@@ -0,0 +1,25 @@
+"""YAML loading helper that prefers the libyaml C bindings when available.
+
+Pure-Python PyYAML parsing is roughly an order of magnitude slower than the
+C loader. The C bindings are an optional part of PyYAML builds, so fall back
+gracefully when they are absent.
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
+
+def yaml_safe_load(stream):
+    """Drop-in replacement for yaml.safe_load using the fastest safe loader.
+
+    Args:
+        stream: A string, bytes, or open file object containing YAML
+
+    Returns:
+        The parsed YAML document
+    """
+    return yaml.load(stream, Loader=_SafeLoader)
@@ -5,9 +5,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from agentready.assessors.structure import (
+    _COHESION_SIZE_LOWER,
+    _COHESION_SIZE_UPPER,
     ArchitecturalBoundaryAssessor,
     IssuePRTemplatesAssessor,
+    SeparationOfConcernsAssessor,
     StandardLayoutAssessor,
+    _count_lines,
 )
 from agentready.models.repository import Repository
 
@@ -1532,3 +1536,91 @@ class TestArchitecturalBoundaryAssessor:
         assessor = ArchitecturalBoundaryAssessor()
         finding = assessor.assess(repo)
         assert finding.status != "not_applicable"
+
+
+class TestSeparationOfConcernsAssessor:
+    """Test SeparationOfConcernsAssessor file-cohesion size bands."""
+
+    def _make_repo(self, tmp_path):
+        (tmp_path / ".git").mkdir(exist_ok=True)
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 10},
+            total_files=5,
+            total_lines=50,
+        )
+
+    def _write_py(self, tmp_path, name, lines):
+        """Write a .py file of exactly `lines` comment lines."""
+        (tmp_path / name).write_text("# padded\n" * lines)
+        return tmp_path / name
+
+    def test_count_lines_exact(self, tmp_path):
+        path = self._write_py(tmp_path, "mod.py", 123)
+        assert _count_lines(str(path)) == 123
+
+    def test_count_lines_stop_after_returns_early(self, tmp_path):
+        path = self._write_py(tmp_path, "mod.py", 600)
+        # Only needs to prove count > stop_after, not finish the file
+        assert _count_lines(str(path), stop_after=500) == 501
+
+    def test_count_lines_empty_file(self, tmp_path):
+        path = tmp_path / "empty.py"
+        path.write_text("")
+        assert _count_lines(str(path)) == 0
+
+    def test_cohesion_bands_classify_by_size_and_lines(self, tmp_path):
+        """Files below/inside/above the size band all land in the stats."""
+        repo = self._make_repo(tmp_path)
+
+        # Below the band: classified small without opening the file
+        (tmp_path / "tiny.py").write_text("x = 1\n")
+        # Inside the band, under the 500-line threshold: long lines keep the
+        # line count low while the byte size sits inside the band
+        (tmp_path / "band_short.py").write_text(("#" * 99 + "\n") * 40)
+        # Inside the band, over the threshold
+        (tmp_path / "band_long.py").write_text("# padded\n" * 600)
+        # Above the band: oversized from the stat alone
+        (tmp_path / "huge.py").write_text("# padded\n" * 2500)
+
+        assert 0 < (tmp_path / "band_short.py").stat().st_size < _COHESION_SIZE_UPPER
+        assert (tmp_path / "band_short.py").stat().st_size >= _COHESION_SIZE_LOWER
+        assert (tmp_path / "huge.py").stat().st_size > _COHESION_SIZE_UPPER
+
+        assessor = SeparationOfConcernsAssessor()
+        py_files, _ = assessor._scan_repo(repo)
+        score, stats = assessor._check_file_cohesion(py_files)
+
+        assert stats == {"total": 4, "oversized": 2}
+        assert score == 50.0
+
+    def test_cohesion_thread_pool_path(self, tmp_path):
+        """More than four ambiguous files takes the thread-pool branch."""
+        repo = self._make_repo(tmp_path)
+        for i in range(3):
+            (tmp_path / f"short_{i}.py").write_text(("#" * 99 + "\n") * 40)
+        for i in range(3):
+            (tmp_path / f"long_{i}.py").write_text("# padded\n" * 600)
+
+        assessor = SeparationOfConcernsAssessor()
+        py_files, _ = assessor._scan_repo(repo)
+        score, stats = assessor._check_file_cohesion(py_files)
+
+        assert stats == {"total": 6, "oversized": 3}
+        assert score == 50.0
+
+    def test_assess_end_to_end_with_band_files(self, tmp_path):
+        """Full assess() run exercises the scan + cohesion + naming checks."""
+        repo = self._make_repo(tmp_path)
+        (tmp_path / "core.py").write_text("# padded\n" * 600)
+        (tmp_path / "api.py").write_text("x = 1\n")
+
+        finding = SeparationOfConcernsAssessor().assess(repo)
+
+        assert finding.status in ("pass", "fail")
+        assert finding.score is not None
+        assert any("1/2 files >500 lines" in e for e in finding.evidence)
@@ -70,7 +70,7 @@ def test_valid_org_names():
     with patch.dict("os.environ", {"GITHUB_TOKEN": token}):
         scanner = GitHubOrgScanner()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             # Mock empty response (no repos)
             mock_response = Mock()
             mock_response.status_code = 200
@@ -101,7 +101,7 @@ def test_token_redaction():
         assert scanner._redact_token(text_without_token) == text_without_token
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_successful_org_scan(mock_get):
     """Test successful organization scan."""
     token = "ghp_" + "a" * 36
@@ -141,7 +141,7 @@ def test_successful_org_scan(mock_get):
         assert "https://github.com/org/repo2.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_filters_private_repos(mock_get):
     """Test that private repos are filtered by default."""
     token = "ghp_" + "a" * 36
@@ -180,7 +180,7 @@ def test_filters_private_repos(mock_get):
         assert "https://github.com/org/public.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_includes_private_repos_when_requested(mock_get):
     """Test that private repos are included when requested."""
     token = "ghp_" + "a" * 36
@@ -220,7 +220,7 @@ def test_includes_private_repos_when_requested(mock_get):
         assert "https://github.com/org/private.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_filters_archived_repos(mock_get):
     """Test that archived repos are always filtered."""
     token = "ghp_" + "a" * 36
@@ -259,7 +259,7 @@ def test_filters_archived_repos(mock_get):
         assert "https://github.com/org/active.git" in repos
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_respects_max_repos_limit(mock_get):
     """Test that max_repos limit is enforced."""
     token = "ghp_" + "a" * 36
@@ -288,7 +288,7 @@ def test_respects_max_repos_limit(mock_get):
         assert len(repos) == 10
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_pagination(mock_get):
     """Test that pagination works correctly."""
     token = "ghp_" + "a" * 36
@@ -339,7 +339,7 @@ def test_pagination(mock_get):
         assert len(repos) == 150
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_404_org_not_found(mock_get):
     """Test handling of 404 (org not found)."""
     token = "ghp_" + "a" * 36
@@ -355,7 +355,7 @@ def test_handles_404_org_not_found(mock_get):
             scanner.get_org_repos("nonexistent")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_401_auth_failed(mock_get):
     """Test handling of 401 (authentication failed)."""
     token = "ghp_" + "a" * 36
@@ -371,7 +371,7 @@ def test_handles_401_auth_failed(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_403_rate_limit(mock_get):
     """Test handling of 403 (rate limit exceeded)."""
     token = "ghp_" + "a" * 36
@@ -388,7 +388,7 @@ def test_handles_403_rate_limit(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_403_authorization_failed(mock_get):
     """Test handling of 403 (authorization failed, not rate limit)."""
     token = "ghp_" + "a" * 36
@@ -405,7 +405,7 @@ def test_handles_403_authorization_failed(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_timeout(mock_get):
     """Test handling of request timeout."""
     token = "ghp_" + "a" * 36
@@ -418,7 +418,7 @@ def test_handles_timeout(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_handles_invalid_json(mock_get):
     """Test handling of invalid JSON response."""
     token = "ghp_" + "a" * 36
@@ -434,7 +434,7 @@ def test_handles_invalid_json(mock_get):
             scanner.get_org_repos("testorg")
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_token_redacted_in_request_exception(mock_get):
     """Test that token is redacted when RequestException contains it."""
     token = "ghp_" + "a" * 36
@@ -453,7 +453,7 @@ def test_token_redacted_in_request_exception(mock_get):
         assert "[REDACTED]" in error_msg
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_rate_limit_warning(mock_get, caplog):
     """Test that low rate limit triggers warning."""
     token = "ghp_" + "a" * 36